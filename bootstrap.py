@@ -14,10 +14,14 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import functools
+import importlib.util
+import os
 import shutil
 import subprocess
 import sys
 from pathlib import Path
+from typing import NoReturn
 
 # Colors for terminal output
 class Colors:
@@ -33,16 +37,58 @@ def print_color(msg: str, color: str = "") -> None:
     else:
         print(msg)
 
+@functools.lru_cache(maxsize=None)
+def resolve(exe: str) -> str | None:
+    """Look up executable on PATH once per bootstrap run."""
+    return shutil.which(exe)
+
 def run(cmd: list[str], check: bool = True) -> int:
     """Run command and return exit code."""
-    result = subprocess.run(cmd)
+    exe = resolve(cmd[0]) or cmd[0]
+    # Skip closing inherited fds in the child; we hold none worth hiding
+    result = subprocess.run([exe, *cmd[1:]], close_fds=sys.platform == "win32")
     if check and result.returncode != 0:
         sys.exit(result.returncode)
     return result.returncode
 
+def run_final(cmd: list[str]) -> NoReturn:
+    """Replace this process with command (terminal commands only)."""
+    sys.stdout.flush()
+    if sys.platform == "win32":
+        # execvp on Windows spawns and detaches, losing the exit code
+        sys.exit(run(cmd, check=False))
+    os.execvp(cmd[0], cmd)
+
+def maturin(*args: str) -> list[str]:
+    """Build maturin command line, preferring the native binary on PATH."""
+    exe = resolve("maturin")
+    if exe:
+        return [exe, *args]
+    # Installed into a venv that is not activated: binary is not on PATH
+    return [sys.executable, "-m", "maturin", *args]
+
+def check_maturin(importable: bool = False) -> None:
+    """Ensure maturin is available, installing it with pip if missing.
+
+    Any maturin binary on PATH (cargo install, pipx, brew) is enough unless
+    ``importable`` is set, which requires the package in this interpreter.
+    """
+    if importlib.util.find_spec("maturin") is not None:
+        return
+    if not importable and resolve("maturin"):
+        return
+    print("Installing maturin...")
+    code = run([sys.executable, "-m", "pip", "install", "maturin"], check=False)
+    if code != 0:
+        print_color("Error: Failed to install maturin", Colors.RED)
+        sys.exit(1)
+    importlib.invalidate_caches()
+    print_color("[OK] maturin installed", Colors.GREEN)
+    print()
+
 def check_cargo() -> None:
     """Ensure cargo is available."""
-    if not shutil.which("cargo"):
+    if not resolve("cargo"):
         print_color("Error: Rust/Cargo not found!", Colors.RED)
         print("Install from: https://rustup.rs/")
         sys.exit(1)
@@ -56,60 +102,52 @@ def cmd_build(args: argparse.Namespace) -> None:
     if not args.debug:
         cmd.append("--release")
 
-    code = run(cmd, check=False)
-    if code == 0:
-        print()
-        print_color("[OK] Build complete!", Colors.GREEN)
-    sys.exit(code)
+    # cargo replaces this process, so announce the command instead of
+    # printing an [OK] banner afterwards
+    print(f"Running {' '.join(cmd)}...")
+    run_final(cmd)
 
 def cmd_python(args: argparse.Namespace) -> None:
     """Build Python module."""
     print_color("Building Python module (exiftool-py)...", Colors.CYAN)
     print()
 
-    # Check maturin
-    if not shutil.which("maturin"):
-        print("Installing maturin...")
-        code = run(["pip", "install", "maturin"], check=False)
-        if code != 0:
-            print_color("Error: Failed to install maturin", Colors.RED)
-            sys.exit(1)
-        print_color("[OK] maturin installed", Colors.GREEN)
-        print()
+    subcmd = args.subcmd if args.subcmd else ""
+    install = subcmd in ("install", "-i", "--install")
+
+    # pip --no-build-isolation imports maturin from this interpreter
+    check_maturin(importable=install)
 
     manifest_path = Path("crates/exiftool-py/Cargo.toml")
     python_dir = Path("crates/exiftool-py/python/exiftool_py")
 
-    # Clean .pyd files to avoid "already added" error
+    # Clean .pyd files to avoid "already added" error and to keep stale
+    # builds (e.g. from another CPython) out of the next wheel
     if python_dir.exists():
-        for pyd in python_dir.glob("*.pyd"):
+        for pyd in python_dir.glob("_core*.pyd"):
             pyd.unlink()
 
-    subcmd = args.subcmd if args.subcmd else ""
-
     if subcmd == "dev":
         print("Installing in development mode...")
-        code = run(["maturin", "develop", "--manifest-path", str(manifest_path)], check=False)
-    elif subcmd in ("install", "-i", "--install"):
+        code = run(maturin("develop", "--manifest-path", str(manifest_path)), check=False)
+    elif install:
         print("Building and installing wheel...")
-        build_cmd = ["maturin", "build", "--manifest-path", str(manifest_path)]
-        if not args.debug:
-            build_cmd.append("--release")
-        code = run(build_cmd, check=False)
-        if code == 0:
-            wheels_dir = Path("target/wheels")
-            wheels = sorted(wheels_dir.glob("exiftool_py*.whl"), key=lambda p: p.stat().st_mtime, reverse=True)
-            if wheels:
-                wheel = wheels[0]
-                print(f"Installing {wheel.name}...")
-                code = run(["pip", "install", str(wheel), "--force-reinstall"], check=False)
+        # pip drives maturin's PEP 517 backend (release by default) in one step
+        install_cmd = [
+            sys.executable, "-m", "pip", "install", "--force-reinstall",
+            "--no-build-isolation", str(manifest_path.parent),
+        ]
+        if args.debug:
+            install_cmd.append("--config-settings=build-args=--profile=dev")
+        code = run(install_cmd, check=False)
     else:
+        build_cmd = maturin("build", "--manifest-path", str(manifest_path))
         if args.debug:
             print("Building debug wheel...")
-            code = run(["maturin", "build", "--manifest-path", str(manifest_path)], check=False)
         else:
             print("Building release wheel...")
-            code = run(["maturin", "build", "--manifest-path", str(manifest_path), "--release"], check=False)
+            build_cmd.append("--release")
+        code = run(build_cmd, check=False)
 
     if code == 0:
         print()
@@ -125,13 +163,12 @@ def cmd_python(args: argparse.Namespace) -> None:
 def cmd_test(args: argparse.Namespace) -> None:
     """Run tests."""
     print_color("Running tests...", Colors.CYAN)
-    cmd = ["cargo", "test"] + args.extra
-    sys.exit(run(cmd, check=False))
+    run_final(["cargo", "test", *args.extra])
 
 def cmd_codegen(args: argparse.Namespace) -> None:
     """Regenerate tag tables."""
     print_color("Regenerating tag tables...", Colors.CYAN)
-    sys.exit(run(["cargo", "xtask", "codegen"], check=False))
+    run_final(["cargo", "xtask", "codegen"])
 
 def cmd_book(args: argparse.Namespace) -> None:
     """Build documentation book."""
@@ -139,7 +176,7 @@ def cmd_book(args: argparse.Namespace) -> None:
     print()
 
     # Check mdbook
-    if not shutil.which("mdbook"):
+    if not resolve("mdbook"):
         print("Installing mdbook...")
         code = run(["cargo", "install", "mdbook"], check=False)
         if code != 0:
@@ -23,8 +23,12 @@ Example:
     >>> img.save()
 """
 
-import asyncio
-from typing import List, Optional
+import os
+import threading
+from typing import TYPE_CHECKING, Optional, Sequence
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
 
 from exiftool_py._core import (
     # Main functions
@@ -51,6 +55,39 @@ __version__ = "0.1.0"
 # Async API
 # =============================================================================
 
+# asyncio and concurrent.futures are imported on first async call only,
+# so sync-only users don't pay for them in `import exiftool_py`.
+
+# Bounded pool for single-file parsing, shared by all open_async() calls.
+_EXECUTOR: Optional["ThreadPoolExecutor"] = None
+
+# Scans already run on the Rust rayon pool; one thread just waits for them.
+_SCAN_EXECUTOR: Optional["ThreadPoolExecutor"] = None
+
+# Guards pool creation when several event loops make their first call at once.
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _executor() -> "ThreadPoolExecutor":
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                from concurrent.futures import ThreadPoolExecutor
+                _EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="exiftool")
+    return _EXECUTOR
+
+
+def _scan_executor() -> "ThreadPoolExecutor":
+    global _SCAN_EXECUTOR
+    if _SCAN_EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _SCAN_EXECUTOR is None:
+                from concurrent.futures import ThreadPoolExecutor
+                _SCAN_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="exiftool-scan")
+    return _SCAN_EXECUTOR
+
+
 async def open_async(path: str) -> Image:
     """Open an image file asynchronously.
 
@@ -64,7 +101,10 @@ async def open_async(path: str) -> Image:
         >>> img = await exif.open_async("photo.jpg")
         >>> print(img.make)
     """
-    return await asyncio.to_thread(open, path)
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor(), open, path)
 
 
 async def scan_async(
@@ -87,12 +127,15 @@ async def scan_async(
         >>> for img in result:
         ...     print(img.path)
     """
-    return await asyncio.to_thread(scan, pattern, parallel, ignore_errors)
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_scan_executor(), scan, pattern, parallel, ignore_errors)
 
 
 async def scan_dir_async(
     directory: str,
-    extensions: Optional[List[str]] = None,
+    extensions: Optional[Sequence[str]] = None,
     parallel: bool = True,
 ) -> ScanResult:
     """Scan single directory asynchronously.
@@ -105,7 +148,10 @@ async def scan_dir_async(
     Returns:
         ScanResult iterator over Image objects
     """
-    return await asyncio.to_thread(scan_dir, directory, extensions, parallel)
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_scan_executor(), scan_dir, directory, extensions, parallel)
 
 
 __all__ = [
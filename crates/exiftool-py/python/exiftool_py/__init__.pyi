@@ -11,7 +11,7 @@ Supported formats:
     Audio: MP3, FLAC, WAV, AIFF, OGG, AAC, ALAC, APE, WavPack, DSF, TAK, MIDI
 """
 
-from typing import Any, Coroutine, Iterator, Optional, Union, List, Tuple, Dict
+from typing import Any, Coroutine, Iterator, Optional, Union, List, Sequence, Tuple, Dict
 from os import PathLike
 
 __version__: str
@@ -844,7 +844,7 @@ def scan(
 
 def scan_dir(
     directory: str,
-    extensions: Optional[List[str]] = None,
+    extensions: Optional[Sequence[str]] = None,
     parallel: bool = True,
 ) -> ScanResult:
     """Scan single directory for image files.
@@ -910,7 +910,7 @@ async def scan_async(
 
 async def scan_dir_async(
     directory: str,
-    extensions: Optional[List[str]] = None,
+    extensions: Optional[Sequence[str]] = None,
     parallel: bool = True,
 ) -> ScanResult:
     """Scan single directory asynchronously.
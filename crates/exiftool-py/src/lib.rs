@@ -51,6 +51,7 @@ fn _core(m: &Bound<'_, PyModule>) -> PyResult<()> {
 /// Raises:
 ///     FormatError: If the file cannot be parsed
 #[pyfunction]
-fn open(path: &str) -> PyResult<image::PyImage> {
-    image::PyImage::open(path)
+fn open(py: Python<'_>, path: &str) -> PyResult<image::PyImage> {
+    // Parse without holding the GIL so concurrent open_async() calls overlap
+    py.detach(|| image::PyImage::open(path))
 }
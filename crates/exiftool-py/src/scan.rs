@@ -51,6 +51,15 @@ pub fn scan(
         .filter(|p| p.is_file())
         .collect();
 
+    // Parse without holding the GIL; failures are always kept in `errors`
+    let _ = ignore_errors;
+    let (images, errors) = py.detach(|| collect(paths, parallel));
+
+    Py::new(py, PyScanResult { images, errors, index: 0 })
+}
+
+/// Parse all paths, separating successes from errors.
+fn collect(paths: Vec<PathBuf>, parallel: bool) -> (Vec<PyImage>, Vec<ScanError>) {
     // Process files and collect results
     let results: Vec<(PathBuf, Result<PyImage, String>)> = if parallel {
         paths
@@ -70,12 +79,6 @@ pub fn scan(
     for (path, result) in results {
         match result {
             Ok(img) => images.push(img),
-            Err(e) if ignore_errors => {
-                errors.push(ScanError {
-                    path: path.to_string_lossy().to_string(),
-                    error: e,
-                });
-            }
             Err(e) => {
                 errors.push(ScanError {
                     path: path.to_string_lossy().to_string(),
@@ -84,8 +87,7 @@ pub fn scan(
             }
         }
     }
-
-    Py::new(py, PyScanResult { images, errors, index: 0 })
+    (images, errors)
 }
 
 /// Try to open image, returning Ok(image) or Err(error_message).
@@ -186,33 +188,8 @@ pub fn scan_dir(
         }
     }
 
-    // Process and collect results
-    let results: Vec<(PathBuf, Result<PyImage, String>)> = if parallel {
-        all_paths
-            .par_iter()
-            .map(|path| (path.clone(), try_open_image(path)))
-            .collect()
-    } else {
-        all_paths
-            .iter()
-            .map(|path| (path.clone(), try_open_image(path)))
-            .collect()
-    };
-
-    // Separate successes and errors
-    let mut images = Vec::new();
-    let mut errors = Vec::new();
-    for (path, result) in results {
-        match result {
-            Ok(img) => images.push(img),
-            Err(e) => {
-                errors.push(ScanError {
-                    path: path.to_string_lossy().to_string(),
-                    error: e,
-                });
-            }
-        }
-    }
+    // Parse without holding the GIL
+    let (images, errors) = py.detach(|| collect(all_paths, parallel));
 
     Py::new(py, PyScanResult { images, errors, index: 0 })
 }
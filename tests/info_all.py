@@ -1,11 +1,20 @@
 """Test exiftool_py - print all metadata from all test files."""
+import glob
 import json
+import sys
 from pathlib import Path
 
 import exiftool_py as exif
 
 TEST_DIR = Path(__file__).parent
-EXTENSIONS = (".jpg", ".jpeg", ".png", ".tiff", ".tif", ".heic", ".exr", ".hdr", ".raf", ".nef")
+EXTENSIONS = ("exr", "hdr", "heic", "jpeg", "jpg", "nef", "png", "raf", "tif", "tiff")
+
+
+def truncate(s: str, limit: int = 60) -> str:
+    """Truncate long values for display."""
+    if len(s) > limit:
+        return s[:limit - 3] + "..."
+    return s
 
 
 def main():
@@ -13,58 +22,68 @@ def main():
     print(f"Scanning: {TEST_DIR}")
     print("=" * 70)
 
-    for path in sorted(TEST_DIR.iterdir()):
-        if path.suffix.lower() not in EXTENSIONS:
-            continue
+    # scan_dir globs "<dir>/*.<ext>", so escape glob metacharacters in the path
+    result = exif.scan_dir(
+        glob.escape(str(TEST_DIR)),
+        extensions=EXTENSIONS,
+        parallel=True,
+    )
+    images = {img.path: img for img in result}
+    failures = {err.path: err.error for err in result.errors}
 
-        print(f"\n{'=' * 70}")
-        print(f"FILE: {path.name}")
-        print("=" * 70)
+    for path in sorted(images.keys() | failures.keys()):
+        # Collect the whole report for this file, then write it once
+        buf = [
+            f"\n{'=' * 70}",
+            f"FILE: {Path(path).name}",
+            "=" * 70,
+        ]
 
-        try:
-            img = exif.open(str(path))
-            print(f"Format: {img.format}")
-            print(f"Tags: {len(img)}")
-            print()
+        if path in failures:
+            buf.append(f"ERROR: {failures[path]}")
+            sys.stdout.write("\n".join(buf) + "\n")
+            continue
 
+        img = images[path]
+        buf += [
+            f"Format: {img.format}",
+            f"Tags: {len(img)}",
+            "",
             # Common properties
-            print("--- Properties ---")
-            print(f"  Make: {img.make}")
-            print(f"  Model: {img.model}")
-            print(f"  DateTime: {img.datetime}")
-            print(f"  DateTimeOriginal: {img.datetime_original}")
-            print(f"  ISO: {img.iso}")
-            print(f"  FNumber: {img.fnumber}")
-            print(f"  Exposure: {img.exposure_time}")
-            print(f"  FocalLength: {img.focal_length}")
-            print(f"  Width: {img.width}")
-            print(f"  Height: {img.height}")
-            print(f"  GPS: {img.gps}")
-            print()
-
-            # All tags
-            print("--- All Tags ---")
-            for tag, value in sorted(img.items()):
-                # Truncate long values
-                s = str(value)
-                if len(s) > 60:
-                    s = s[:57] + "..."
-                print(f"  {tag}: {s}")
-
-            # JSON output
-            print()
-            print("--- JSON ---")
-            d = dict(img)
-            # Convert non-serializable to strings
-            for k, v in d.items():
-                if isinstance(v, bytes):
-                    d[k] = f"<{len(v)} bytes>"
-                elif hasattr(v, 'as_tuple'):  # Rational
-                    d[k] = str(v)
-            print(json.dumps(d, indent=2, default=str)[:500] + "...")
-
-        except exif.FormatError as e:
-            print(f"ERROR: {e}")
+            "--- Properties ---",
+            f"  Make: {img.make}",
+            f"  Model: {img.model}",
+            f"  DateTime: {img.datetime}",
+            f"  DateTimeOriginal: {img.datetime_original}",
+            f"  ISO: {img.iso}",
+            f"  FNumber: {img.fnumber}",
+            f"  Exposure: {img.exposure_time}",
+            f"  FocalLength: {img.focal_length}",
+            f"  Width: {img.width}",
+            f"  Height: {img.height}",
+            f"  GPS: {img.gps}",
+            "",
+        ]
+
+        # Materialize tags once; reused for printing and JSON
+        tags = dict(img.items())
+
+        # All tags
+        buf.append("--- All Tags ---")
+        buf.extend(f"  {tag}: {truncate(str(value))}" for tag, value in sorted(tags.items()))
+
+        # JSON output
+        buf.append("")
+        buf.append("--- JSON ---")
+        # Convert non-serializable to strings
+        for k, v in tags.items():
+            if isinstance(v, bytes):
+                tags[k] = f"<{len(v)} bytes>"
+            elif hasattr(v, 'as_tuple'):  # Rational
+                tags[k] = str(v)
+        buf.append(json.dumps(tags, indent=2, default=str)[:500] + "...")
+
+        sys.stdout.write("\n".join(buf) + "\n")
 
     print("\n" + "=" * 70)
     print("Done!")